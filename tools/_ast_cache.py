@@ -0,0 +1,122 @@
+"""
+Persistent AST cache for the application review tool.
+
+Caches parsed ASTs in a sqlite database under ~/.cache/cursor-commands/
+keyed by file path and content SHA-256, so repeated reviews of an
+unchanged codebase skip ast.parse entirely.
+"""
+
+import ast
+import atexit
+import logging
+import os
+import pickle
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+# ast nodes pickle cleanly on 3.8+; disable the cache on anything older
+_PICKLE_OK = sys.version_info >= (3, 8)
+
+_CACHE_DIR = Path.home() / ".cache" / "cursor-commands"
+_DB_PATH = _CACHE_DIR / "ast.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ast_cache (
+    path TEXT PRIMARY KEY,
+    sha256 BLOB,
+    pickled_tree BLOB,
+    mtime REAL
+)
+"""
+
+_connection: Optional[sqlite3.Connection] = None
+
+
+def _get_connection() -> Optional[sqlite3.Connection]:
+    """Open (once) and return the cache database connection, or None on failure."""
+    global _connection
+    if _connection is None:
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            _connection = sqlite3.connect(str(_DB_PATH))
+            _connection.execute(_SCHEMA)
+            atexit.register(flush)
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"AST cache unavailable: {e}")
+            return None
+    return _connection
+
+
+def get(path: str, sha256: bytes) -> Optional[ast.AST]:
+    """
+    Look up a cached AST for a file.
+
+    Args:
+        path: Absolute path of the source file.
+        sha256: SHA-256 digest of the file content.
+
+    Returns:
+        Cached AST if the stored digest matches, None otherwise.
+    """
+    if not _PICKLE_OK:
+        return None
+
+    conn = _get_connection()
+    if conn is None:
+        return None
+
+    try:
+        row = conn.execute(
+            "SELECT sha256, pickled_tree FROM ast_cache WHERE path = ?", (path,)
+        ).fetchone()
+        # Invalidate on content change: compare digests, not mtime (fragile)
+        if row is not None and row[0] == sha256:
+            return pickle.loads(row[1])
+    except (sqlite3.Error, pickle.PickleError, AttributeError) as e:
+        logger.debug(f"AST cache read failed for {path}: {e}")
+    return None
+
+
+def put(path: str, sha256: bytes, tree: ast.AST):
+    """
+    Store a parsed AST. Commits are deferred to flush().
+
+    Args:
+        path: Absolute path of the source file.
+        sha256: SHA-256 digest of the file content.
+        tree: Parsed AST to cache.
+    """
+    if not _PICKLE_OK:
+        return
+
+    conn = _get_connection()
+    if conn is None:
+        return
+
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = 0.0
+
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO ast_cache (path, sha256, pickled_tree, mtime) "
+            "VALUES (?, ?, ?, ?)",
+            (path, sha256, pickle.dumps(tree, protocol=5), mtime)
+        )
+    except (sqlite3.Error, pickle.PickleError) as e:
+        logger.debug(f"AST cache write failed for {path}: {e}")
+
+
+def flush():
+    """Commit pending cache writes. Called once per review and at exit."""
+    if _connection is not None:
+        try:
+            _connection.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"AST cache commit failed: {e}")
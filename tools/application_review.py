@@ -9,24 +9,90 @@ This tool analyzes applications and provides comprehensive reviews including:
 - Documentation review
 """
 
+import array
 import ast
+import bisect
+import io
+import sys
+import hashlib
+import importlib.util
 import os
 import re
 import json
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
-from collections import defaultdict
+from dataclasses import dataclass
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntEnum
+from functools import lru_cache, partial
+
+try:
+    import _ast_cache
+except ImportError:
+    from tools import _ast_cache
 
 
 logger = logging.getLogger(__name__)
 
+# Below this many files, worker-process startup costs more than it saves
+_PARALLEL_THRESHOLD = 32
+
+# Files with no def/class/except are still parsed up to this size so
+# syntax errors in them get reported; above it the parse is skipped
+_PREFILTER_PARSE_LIMIT = 64 * 1024
+
+# Generated/vendored trees that are never relevant to a review
+_SKIP_DIRS = frozenset({
+    '__pycache__', '.git', 'node_modules', '.venv', 'venv', 'dist', 'build'
+})
+
+# Compiled once at import; rebuilding patterns per file is pure overhead.
+# Patterns are pure ASCII, so they run as bytes regexes over the raw file
+# content and no UTF-8 decode is needed for the scanning phase
+_IMPORT_RE = re.compile(rb'^\s*(?:import|from)\s')
+
+# All needles combined into one scanner so each file is swept in a single
+# C-level pass instead of several Python-level per-line loops
+_SCANNER = re.compile(
+    rb'(?P<coffe>coffe_master)'
+    rb'|(?P<print>^[ \t]*print\()'
+    rb'|(?P<abs>["\'](?:/home|/Users|C:\\|/tmp/[^/]+)["\'])'
+    rb'|(?P<hailo>(?:^|\s)(?:import|from)\s+hailo(?:_apps)?\b)'
+    rb'|(?P<loiter>LOITER_THRESHOLD|RESET_TIMEOUT)',
+    re.MULTILINE
+)
+
+
+class Severity(IntEnum):
+    """Severity levels, ordered most to least severe.
+
+    Integer values let issues be bucketed by direct list indexing; the
+    member name is what appears in reports and JSON output.
+    """
+    CRITICAL = 0
+    HIGH = 1
+    MEDIUM = 2
+    LOW = 3
+
+    def __str__(self) -> str:
+        return self.name
 
-@dataclass
+
+class Category:
+    """Interned category constants so every Issue shares the same objects."""
+    BUG = sys.intern('BUG')
+    CODE_QUALITY = sys.intern('CODE_QUALITY')
+    ARCHITECTURE = sys.intern('ARCHITECTURE')
+    TESTING = sys.intern('TESTING')
+    DOCUMENTATION = sys.intern('DOCUMENTATION')
+
+
+@dataclass(slots=True)
 class Issue:
     """Represents an issue found during review."""
-    severity: str  # CRITICAL, HIGH, MEDIUM, LOW
+    severity: Severity
     category: str  # BUG, CODE_QUALITY, ARCHITECTURE, TESTING, DOCUMENTATION
     file_path: str
     line_number: Optional[int]
@@ -35,7 +101,7 @@ class Issue:
     code_snippet: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewResult:
     """Complete review result for an application."""
     application_name: str
@@ -47,6 +113,319 @@ class ReviewResult:
     recommendations: List[str]
 
 
+def _has_docstring(node: ast.AST) -> bool:
+    """
+    Check docstring presence directly on the node body.
+
+    This is what ast.get_docstring does internally, minus the cleandoc
+    normalization we don't need just to test for existence.
+
+    Args:
+        node: Module or function node.
+
+    Returns:
+        True if the node's first statement is a string literal.
+    """
+    body = getattr(node, 'body', None)
+    return bool(body) and isinstance(body[0], ast.Expr) \
+        and isinstance(body[0].value, ast.Constant) \
+        and isinstance(body[0].value.value, str)
+
+
+# Parses not yet persisted to the sqlite cache. Workers never write to
+# sqlite themselves: pool processes exit via os._exit, so their deferred
+# commits would be lost (and N writers would contend on one database).
+# Instead _review_file hands these back and review() does the puts.
+_pending_cache_puts: List[Tuple[str, bytes, ast.AST]] = []
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> ast.AST:
+    """
+    Parse a file, cached per (path, mtime, size) for the process lifetime.
+
+    Repeated review_application calls in the same process (as Cursor does
+    per tool call) hit the LRU without touching sha256, sqlite or
+    ast.parse. The stat signature keys the entry; the content digest
+    still guards the persistent cache underneath. Cache misses are
+    recorded in _pending_cache_puts for the reviewing process to persist.
+    Tests can reset with _parse_cached.cache_clear().
+
+    Args:
+        path_str: Absolute path of the source file.
+        mtime_ns: File modification time in nanoseconds.
+        size: File size in bytes.
+
+    Returns:
+        Parsed AST.
+    """
+    raw = Path(path_str).read_bytes()
+    # Try the persistent cache before paying for ast.parse
+    sha = hashlib.sha256(raw).digest()
+    tree = _ast_cache.get(path_str, sha)
+    if tree is None:
+        # ast.parse accepts bytes and honors the source encoding itself,
+        # so the file is never decoded just for scanning. type_comments
+        # stays off: collecting them costs parse time and no check here
+        # reads them.
+        tree = ast.parse(raw, filename=path_str, type_comments=False)
+        _pending_cache_puts.append((path_str, sha, tree))
+    return tree
+
+
+def _leading_docstring(raw: bytes) -> bool:
+    """
+    Byte-level module-docstring test for files that skip ast.parse.
+
+    Only reached for large modules with no def/class/except anywhere,
+    where the docstring question reduces to: does the first statement
+    line start with a string literal?
+
+    Args:
+        raw: Raw file content.
+
+    Returns:
+        True if the module's first statement looks like a docstring.
+    """
+    for line in raw.split(b'\n'):
+        stripped = line.strip()
+        if not stripped or stripped.startswith(b'#'):
+            continue
+        return stripped.lstrip(b'rbuRBU').startswith((b'"', b"'"))
+    return False
+
+def _review_file(
+    py_file: Path, app_path: Path, config_yaml_exists: bool
+) -> Tuple[List[Issue], bool, bool, List[Tuple[str, bytes, ast.AST]]]:
+    """
+    Run all per-file checks on a single file with one read/parse/walk.
+
+    Pure function (no reviewer state) so it can run in worker processes.
+
+    Args:
+        py_file: Path to Python file.
+        app_path: Application root, for relative issue paths.
+        config_yaml_exists: Whether the application has a config.yaml.
+
+    Returns:
+        Tuple of (issues found, hailo imports seen, hailo_apps imports
+        seen, freshly parsed (path, sha256, tree) entries for the caller
+        to persist to the AST cache).
+    """
+    issues: List[Issue] = []
+    hailo_found = False
+    hailo_apps_found = False
+
+    try:
+        raw = py_file.read_bytes()
+        st = os.stat(py_file)
+    except OSError as e:
+        logger.debug(f"Error reading {py_file}: {e}")
+        return issues, hailo_found, hailo_apps_found, []
+
+    # Cheap prefilter: a file with none of these byte sequences cannot
+    # produce any AST-check finding. Small files are parsed regardless so
+    # syntax errors in them are still reported; only large def-less files
+    # (generated tables and the like, where parsing actually costs) skip
+    # ast.parse, accepting that a syntax error there goes undetected.
+    # The module-docstring check falls back to a byte-level test below.
+    if (b'def ' in raw or b'class ' in raw or b'except' in raw
+            or st.st_size <= _PREFILTER_PARSE_LIMIT):
+        try:
+            tree = _parse_cached(str(py_file), st.st_mtime_ns, st.st_size)
+        except SyntaxError as e:
+            # One reported issue per broken file; the AST checks are
+            # skipped cleanly instead of re-raising once per check
+            issues.append(Issue(
+                severity=Severity.HIGH,
+                category=Category.BUG,
+                file_path=str(py_file.relative_to(app_path)),
+                line_number=e.lineno,
+                description=f"Syntax error: {e.msg}",
+                recommendation="Fix the syntax error so the file can be analyzed"
+            ))
+            return issues, hailo_found, hailo_apps_found, []
+        except (OSError, ValueError) as e:
+            logger.debug(f"Error reading {py_file}: {e}")
+            return issues, hailo_found, hailo_apps_found, []
+    else:
+        tree = None
+
+    # Hand any fresh parse back to the caller; see _pending_cache_puts
+    cache_puts = _pending_cache_puts[:]
+    _pending_cache_puts.clear()
+
+    # Computed once per file; these were previously rebuilt per issue/line
+    path_str = str(py_file)
+    path_lower = path_str.lower()
+    is_test = 'test' in path_lower
+    rel_path = str(py_file.relative_to(app_path))
+
+    has_logging = b'import logging' in raw or b'from logging' in raw
+
+    # Line-start offsets, built once on first use; bisect turns any match
+    # offset into a 1-based line number without rescanning the content
+    line_starts = None
+
+    # One combined scan over the whole file instead of per-line loops
+    hardcoded_config = False
+    for m in _SCANNER.finditer(raw):
+        group = m.lastgroup
+
+        # Matches that only set per-file flags need no line context
+        if group == 'hailo':
+            if b'hailo_apps' in m.group():
+                hailo_apps_found = True
+            else:
+                hailo_found = True
+            continue
+        if group == 'loiter':
+            hardcoded_config = True
+            continue
+
+        # Recover the matched line and its number from the match offset;
+        # only this single line is ever decoded to text
+        line_start = raw.rfind(b'\n', 0, m.start()) + 1
+        line_end = raw.find(b'\n', m.start())
+        if line_end == -1:
+            line_end = len(raw)
+        line_bytes = raw[line_start:line_end]
+        line = line_bytes.decode('utf-8', errors='replace')
+        if line_starts is None:
+            # bytes.find runs at C speed; enumerating every byte in
+            # Python was the slow part of building this index
+            line_starts = array.array('q', (0,))
+            pos = raw.find(b'\n')
+            while pos != -1:
+                line_starts.append(pos + 1)
+                pos = raw.find(b'\n', pos + 1)
+        line_number = bisect.bisect_right(line_starts, m.start())
+
+        if group == 'coffe':
+            # Check for common typos
+            if _IMPORT_RE.match(line_bytes) and 'coffee_master' in path_str:
+                issues.append(Issue(
+                    severity=Severity.CRITICAL,
+                    category=Category.BUG,
+                    file_path=rel_path,
+                    line_number=line_number,
+                    description="Typo in module name: 'coffe_master' should be 'coffee_master'",
+                    recommendation="Fix import to use correct module name",
+                    code_snippet=line.strip()
+                ))
+
+        elif group == 'abs':
+            # Check if it's a legitimate use (like os.path.join with variables)
+            if not is_test and 'os.path.join' not in line and 'Path(' not in line:
+                issues.append(Issue(
+                    severity=Severity.CRITICAL,
+                    category=Category.BUG,
+                    file_path=rel_path,
+                    line_number=line_number,
+                    description="Hardcoded absolute path detected",
+                    recommendation="Use relative paths with Path(__file__).parent or os.path.join",
+                    code_snippet=line.strip()
+                ))
+
+        elif group == 'print':
+            if not is_test:
+                severity = Severity.MEDIUM if has_logging else Severity.HIGH
+                issues.append(Issue(
+                    severity=severity,
+                    category=Category.CODE_QUALITY,
+                    file_path=rel_path,
+                    line_number=line_number,
+                    description="Print statement found instead of logging",
+                    recommendation="Replace with logger.info/debug/error",
+                    code_snippet=line.strip()
+                ))
+
+    # Content-based checks: thread safety, configuration, hailo imports
+    if b'open(' in raw and b'json.load' in raw:
+        if b'threading.Lock' not in raw and b'multiprocessing.Lock' not in raw:
+            # Check if it's a database or config file
+            if 'database' in path_lower or 'config' in path_lower:
+                issues.append(Issue(
+                    severity=Severity.HIGH,
+                    category=Category.BUG,
+                    file_path=rel_path,
+                    line_number=None,
+                    description="File I/O operations without thread-safety mechanisms",
+                    recommendation="Add threading.Lock for concurrent access"
+                ))
+
+    # Magic numbers that might be configurable (flagged by the scanner)
+    if not config_yaml_exists and hardcoded_config and b'config.yaml' not in raw:
+        issues.append(Issue(
+            severity=Severity.MEDIUM,
+            category=Category.ARCHITECTURE,
+            file_path=rel_path,
+            line_number=None,
+            description="Hardcoded configuration values",
+            recommendation="Move tunable parameters to config.yaml"
+        ))
+
+    # Check module docstring
+    has_module_doc = _has_docstring(tree) if tree is not None else _leading_docstring(raw)
+    if not has_module_doc and not is_test:
+        issues.append(Issue(
+            severity=Severity.LOW,
+            category=Category.DOCUMENTATION,
+            file_path=rel_path,
+            line_number=1,
+            description="Module missing docstring",
+            recommendation="Add module-level docstring"
+        ))
+
+    # AST-based checks share a single walk; skipped when the prefilter
+    # proved there is nothing for them to find
+    for node in ast.walk(tree) if tree is not None else ():
+        if isinstance(node, ast.ExceptHandler):
+            if node.type is None:
+                issues.append(Issue(
+                    severity=Severity.HIGH,
+                    category=Category.CODE_QUALITY,
+                    file_path=rel_path,
+                    line_number=node.lineno,
+                    description="Bare except clause detected",
+                    recommendation="Use specific exception types (e.g., except ValueError:)"
+                ))
+
+        elif isinstance(node, ast.FunctionDef):
+            # Skip test files and private methods
+            if is_test or node.name.startswith('_'):
+                continue
+
+            # Check if function has type hints
+            if not node.returns and len(node.args.args) > 0:
+                # Check if any args have type hints
+                has_any_hints = any(
+                    arg.annotation is not None for arg in node.args.args
+                )
+
+                if not has_any_hints and node.name != '__init__':
+                    issues.append(Issue(
+                        severity=Severity.LOW,
+                        category=Category.CODE_QUALITY,
+                        file_path=rel_path,
+                        line_number=node.lineno,
+                        description=f"Function '{node.name}' missing type hints",
+                        recommendation="Add type hints for parameters and return type"
+                    ))
+
+            if not _has_docstring(node):
+                issues.append(Issue(
+                    severity=Severity.LOW,
+                    category=Category.DOCUMENTATION,
+                    file_path=rel_path,
+                    line_number=node.lineno,
+                    description=f"Function '{node.name}' missing docstring",
+                    recommendation="Add Google-style docstring"
+                ))
+
+    return issues, hailo_found, hailo_apps_found, cache_puts
+
+
 class ApplicationReviewer:
     """
     Reviews applications for code quality, bugs, and best practices.
@@ -63,6 +442,8 @@ class ApplicationReviewer:
         self.issues: List[Issue] = []
         self.python_files: List[Path] = []
         self.config_files: List[Path] = []
+        self._hailo_imports_found = False
+        self._hailo_apps_imports_found = False
 
     def review(self) -> ReviewResult:
         """
@@ -76,15 +457,47 @@ class ApplicationReviewer:
         # Discover files
         self._discover_files()
 
-        # Run checks
-        self._check_imports()
-        self._check_hardcoded_paths()
-        self._check_error_handling()
-        self._check_logging()
-        self._check_type_hints()
-        self._check_docstrings()
-        self._check_thread_safety()
-        self._check_configuration()
+        # Per-file checks: one read, one parse, one AST walk per file
+        config_yaml_exists = (self.app_path / "config.yaml").exists()
+        if len(self.python_files) >= _PARALLEL_THRESHOLD:
+            # ast.parse holds the GIL, so fan out across processes;
+            # chunking amortizes the pickling of paths and results
+            review_one = partial(
+                _review_file,
+                app_path=self.app_path,
+                config_yaml_exists=config_yaml_exists
+            )
+            chunksize = max(1, len(self.python_files) // ((os.cpu_count() or 1) * 4))
+            with ProcessPoolExecutor() as executor:
+                results = executor.map(review_one, self.python_files, chunksize=chunksize)
+                for issues, hailo_found, hailo_apps_found, cache_puts in results:
+                    for issue in issues:
+                        # Unpickled strings lose interning; restore it so
+                        # identity comparisons and sharing keep working.
+                        # (Enum members already unpickle to the singletons.)
+                        issue.category = sys.intern(issue.category)
+                    self.issues.extend(issues)
+                    self._hailo_imports_found |= hailo_found
+                    self._hailo_apps_imports_found |= hailo_apps_found
+                    # Workers can't persist (they exit without flushing);
+                    # this process is the sole sqlite writer
+                    for path_str, sha, tree in cache_puts:
+                        _ast_cache.put(path_str, sha, tree)
+        else:
+            # Small apps: process startup would cost more than it saves
+            for py_file in self.python_files:
+                issues, hailo_found, hailo_apps_found, cache_puts = _review_file(
+                    py_file, self.app_path, config_yaml_exists
+                )
+                self.issues.extend(issues)
+                self._hailo_imports_found |= hailo_found
+                self._hailo_apps_imports_found |= hailo_apps_found
+                for path_str, sha, tree in cache_puts:
+                    _ast_cache.put(path_str, sha, tree)
+        # One commit per review instead of one per parsed file
+        _ast_cache.flush()
+
+        # Application-level checks
         self._check_test_coverage()
         self._check_documentation()
         self._check_hailo_dependencies()
@@ -98,246 +511,49 @@ class ApplicationReviewer:
             logger.warning(f"Path does not exist: {self.app_path}")
             return
 
-        # Find Python files
-        for py_file in self.app_path.rglob("*.py"):
-            if "__pycache__" not in str(py_file):
-                self.python_files.append(py_file)
-
-        # Find config files
-        for config_file in self.app_path.rglob("*.yaml"):
-            self.config_files.append(config_file)
-        for config_file in self.app_path.rglob("*.yml"):
-            self.config_files.append(config_file)
-        for config_file in self.app_path.rglob("*.json"):
-            if "database.json" not in str(config_file):  # Skip test databases
-                self.config_files.append(config_file)
-
-    def _check_imports(self):
-        """Check for import issues."""
-        for py_file in self.python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-
-                    # Check for typos in module names
-                    for i, line in enumerate(lines, 1):
-                        if 'import' in line or 'from' in line:
-                            # Check for common typos
-                            if 'coffe_master' in line and 'coffee_master' in str(py_file):
-                                self.issues.append(Issue(
-                                    severity="CRITICAL",
-                                    category="BUG",
-                                    file_path=str(py_file.relative_to(self.app_path)),
-                                    line_number=i,
-                                    description="Typo in module name: 'coffe_master' should be 'coffee_master'",
-                                    recommendation="Fix import to use correct module name",
-                                    code_snippet=line.strip()
-                                ))
-            except Exception as e:
-                logger.debug(f"Error checking imports in {py_file}: {e}")
-
-    def _check_hardcoded_paths(self):
-        """Check for hardcoded absolute paths."""
-        for py_file in self.python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-
-                    # Pattern for absolute paths
-                    path_pattern = re.compile(r'["\'](/home|/Users|C:\\|/tmp/[^/]+)["\']')
-
-                    for i, line in enumerate(lines, 1):
-                        if path_pattern.search(line) and 'test' not in str(py_file).lower():
-                            # Check if it's a legitimate use (like os.path.join with variables)
-                            if 'os.path.join' not in line and 'Path(' not in line:
-                                self.issues.append(Issue(
-                                    severity="CRITICAL",
-                                    category="BUG",
-                                    file_path=str(py_file.relative_to(self.app_path)),
-                                    line_number=i,
-                                    description="Hardcoded absolute path detected",
-                                    recommendation="Use relative paths with Path(__file__).parent or os.path.join",
-                                    code_snippet=line.strip()
-                                ))
-            except Exception as e:
-                logger.debug(f"Error checking paths in {py_file}: {e}")
-
-    def _check_error_handling(self):
-        """Check for missing error handling."""
-        for py_file in self.python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    tree = ast.parse(content, filename=str(py_file))
-
-                    # Check for bare except clauses
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.ExceptHandler):
-                            if node.type is None:
-                                self.issues.append(Issue(
-                                    severity="HIGH",
-                                    category="CODE_QUALITY",
-                                    file_path=str(py_file.relative_to(self.app_path)),
-                                    line_number=node.lineno,
-                                    description="Bare except clause detected",
-                                    recommendation="Use specific exception types (e.g., except ValueError:)"
-                                ))
-            except Exception as e:
-                logger.debug(f"Error checking error handling in {py_file}: {e}")
-
-    def _check_logging(self):
-        """Check for print statements instead of logging."""
-        for py_file in self.python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-
-                    has_logging = 'import logging' in content or 'from logging' in content
-
-                    for i, line in enumerate(lines, 1):
-                        stripped = line.strip()
-                        if stripped.startswith('print(') and 'test' not in str(py_file).lower():
-                            severity = "MEDIUM" if has_logging else "HIGH"
-                            self.issues.append(Issue(
-                                severity=severity,
-                                category="CODE_QUALITY",
-                                file_path=str(py_file.relative_to(self.app_path)),
-                                line_number=i,
-                                description="Print statement found instead of logging",
-                                recommendation="Replace with logger.info/debug/error",
-                                code_snippet=line.strip()
-                            ))
-            except Exception as e:
-                logger.debug(f"Error checking logging in {py_file}: {e}")
-
-    def _check_type_hints(self):
-        """Check for missing type hints."""
-        for py_file in self.python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    tree = ast.parse(content, filename=str(py_file))
-
-                    # Check function definitions
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.FunctionDef):
-                            # Skip test files and private methods
-                            if 'test' in str(py_file).lower() or node.name.startswith('_'):
-                                continue
-
-                            # Check if function has type hints
-                            if not node.returns and len(node.args.args) > 0:
-                                # Check if any args have type hints
-                                has_any_hints = any(
-                                    arg.annotation is not None for arg in node.args.args
-                                )
-
-                                if not has_any_hints and node.name != '__init__':
-                                    self.issues.append(Issue(
-                                        severity="LOW",
-                                        category="CODE_QUALITY",
-                                        file_path=str(py_file.relative_to(self.app_path)),
-                                        line_number=node.lineno,
-                                        description=f"Function '{node.name}' missing type hints",
-                                        recommendation="Add type hints for parameters and return type"
-                                    ))
-            except Exception as e:
-                logger.debug(f"Error checking type hints in {py_file}: {e}")
-
-    def _check_docstrings(self):
-        """Check for missing docstrings."""
-        for py_file in self.python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    tree = ast.parse(content, filename=str(py_file))
-
-                    # Check module docstring
-                    if not ast.get_docstring(tree) and 'test' not in str(py_file).lower():
-                        self.issues.append(Issue(
-                            severity="LOW",
-                            category="DOCUMENTATION",
-                            file_path=str(py_file.relative_to(self.app_path)),
-                            line_number=1,
-                            description="Module missing docstring",
-                            recommendation="Add module-level docstring"
-                        ))
-
-                    # Check function docstrings
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.FunctionDef):
-                            if 'test' in str(py_file).lower() or node.name.startswith('_'):
-                                continue
-
-                            if not ast.get_docstring(node):
-                                self.issues.append(Issue(
-                                    severity="LOW",
-                                    category="DOCUMENTATION",
-                                    file_path=str(py_file.relative_to(self.app_path)),
-                                    line_number=node.lineno,
-                                    description=f"Function '{node.name}' missing docstring",
-                                    recommendation="Add Google-style docstring"
-                                ))
-            except Exception as e:
-                logger.debug(f"Error checking docstrings in {py_file}: {e}")
-
-    def _check_thread_safety(self):
-        """Check for thread-safety issues."""
-        for py_file in self.python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                    # Check for file operations without locks
-                    if 'open(' in content and 'json.load' in content:
-                        if 'threading.Lock' not in content and 'multiprocessing.Lock' not in content:
-                            # Check if it's a database or config file
-                            if 'database' in str(py_file).lower() or 'config' in str(py_file).lower():
-                                self.issues.append(Issue(
-                                    severity="HIGH",
-                                    category="BUG",
-                                    file_path=str(py_file.relative_to(self.app_path)),
-                                    line_number=None,
-                                    description="File I/O operations without thread-safety mechanisms",
-                                    recommendation="Add threading.Lock for concurrent access"
-                                ))
-            except Exception as e:
-                logger.debug(f"Error checking thread safety in {py_file}: {e}")
-
-    def _check_configuration(self):
-        """Check for configuration issues."""
-        # Check if config files exist
-        config_yaml = self.app_path / "config.yaml"
-        if not config_yaml.exists():
-            # Check if there are hardcoded values that should be configurable
-            for py_file in self.python_files:
-                try:
-                    with open(py_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        # Look for magic numbers that might be configurable
-                        if 'LOITER_THRESHOLD' in content or 'RESET_TIMEOUT' in content:
-                            if 'config.yaml' not in content:
-                                self.issues.append(Issue(
-                                    severity="MEDIUM",
-                                    category="ARCHITECTURE",
-                                    file_path=str(py_file.relative_to(self.app_path)),
-                                    line_number=None,
-                                    description="Hardcoded configuration values",
-                                    recommendation="Move tunable parameters to config.yaml"
-                                ))
-                except Exception as e:
-                    logger.debug(f"Error checking configuration in {py_file}: {e}")
+        self._scan_dir(str(self.app_path))
+
+    def _scan_dir(self, root: str):
+        """
+        Walk a directory once with os.scandir, dispatching by extension.
+
+        One walk replaces the four rglob passes (py/yaml/yml/json), and
+        irrelevant directories are pruned wholesale instead of filtering
+        their files one by one.
+
+        Args:
+            root: Directory to scan recursively.
+        """
+        try:
+            entries = os.scandir(root)
+        except OSError as e:
+            logger.debug(f"Error scanning {root}: {e}")
+            return
+
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in _SKIP_DIRS:
+                        self._scan_dir(entry.path)
+                    continue
+
+                ext = name.rpartition('.')[2]
+                if ext == 'py':
+                    self.python_files.append(Path(entry.path))
+                elif ext in ('yaml', 'yml'):
+                    self.config_files.append(Path(entry.path))
+                elif ext == 'json':
+                    if name != 'database.json':  # Skip test databases
+                        self.config_files.append(Path(entry.path))
 
     def _check_test_coverage(self):
         """Check test coverage."""
         test_dir = self.app_path / "tests"
         if not test_dir.exists():
             self.issues.append(Issue(
-                severity="MEDIUM",
-                category="TESTING",
+                severity=Severity.MEDIUM,
+                category=Category.TESTING,
                 file_path="tests/",
                 line_number=None,
                 description="No tests directory found",
@@ -348,8 +564,8 @@ class ApplicationReviewer:
             test_files = list(test_dir.glob("test_*.py"))
             if len(test_files) == 0:
                 self.issues.append(Issue(
-                    severity="MEDIUM",
-                    category="TESTING",
+                    severity=Severity.MEDIUM,
+                    category=Category.TESTING,
                     file_path="tests/",
                     line_number=None,
                     description="No test files found",
@@ -358,54 +574,25 @@ class ApplicationReviewer:
 
     def _check_hailo_dependencies(self):
         """Check if Hailo libraries are properly installed."""
-        # Check for hailo imports in Python files
-        hailo_imports_found = False
-
-        for py_file in self.python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                    # Check for hailo imports
-                    if 'import hailo' in content or 'from hailo' in content:
-                        hailo_imports_found = True
-                        break
-            except Exception as e:
-                logger.debug(f"Error checking hailo dependencies in {py_file}: {e}")
-
-        # Check for hailo_apps imports
-        hailo_apps_imports_found = False
-        for py_file in self.python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if 'from hailo_apps' in content or 'import hailo_apps' in content:
-                        hailo_apps_imports_found = True
-                        break
-            except Exception:
-                pass
-
-        # Report missing hailo if imports are used but not available
-        if hailo_imports_found:
-            try:
-                import hailo  # noqa: F401
-            except ImportError:
+        # Import usage was detected during the per-file pass.
+        # find_spec only checks availability; importing hailo for real
+        # would execute its (heavy) module-level initialization.
+        if self._hailo_imports_found:
+            if importlib.util.find_spec('hailo') is None:
                 self.issues.append(Issue(
-                    severity="CRITICAL",
-                    category="ARCHITECTURE",
+                    severity=Severity.CRITICAL,
+                    category=Category.ARCHITECTURE,
                     file_path="setup/installation",
                     line_number=None,
                     description="Hailo library is imported but not available. This indicates a setup or installation issue.",
                     recommendation="Install Hailo libraries: pip install hailort or follow Hailo installation guide"
                 ))
 
-        if hailo_apps_imports_found:
-            try:
-                import hailo_apps  # noqa: F401
-            except ImportError:
+        if self._hailo_apps_imports_found:
+            if importlib.util.find_spec('hailo_apps') is None:
                 self.issues.append(Issue(
-                    severity="CRITICAL",
-                    category="ARCHITECTURE",
+                    severity=Severity.CRITICAL,
+                    category=Category.ARCHITECTURE,
                     file_path="setup/installation",
                     line_number=None,
                     description="hailo_apps package is imported but not available. This indicates a setup or installation issue.",
@@ -417,8 +604,8 @@ class ApplicationReviewer:
         readme = self.app_path / "README.md"
         if not readme.exists():
             self.issues.append(Issue(
-                severity="LOW",
-                category="DOCUMENTATION",
+                severity=Severity.LOW,
+                category=Category.DOCUMENTATION,
                 file_path="README.md",
                 line_number=None,
                 description="Missing README.md",
@@ -427,19 +614,17 @@ class ApplicationReviewer:
 
     def _generate_result(self) -> ReviewResult:
         """Generate review result from collected issues."""
-        # Count by severity
-        issues_by_severity = defaultdict(int)
-        for issue in self.issues:
-            issues_by_severity[issue.severity] += 1
-
-        # Count by category
-        issues_by_category = defaultdict(int)
+        # Count by severity and category in a single pass; severity keys
+        # are the member names so serialized results stay readable
+        issues_by_severity: Counter = Counter()
+        issues_by_category: Counter = Counter()
         for issue in self.issues:
+            issues_by_severity[issue.severity.name] += 1
             issues_by_category[issue.category] += 1
 
         # Generate summary
-        critical_count = issues_by_severity.get("CRITICAL", 0)
-        high_count = issues_by_severity.get("HIGH", 0)
+        critical_count = issues_by_severity.get(Severity.CRITICAL.name, 0)
+        high_count = issues_by_severity.get(Severity.HIGH.name, 0)
 
         if critical_count > 0:
             summary = f"CRITICAL: {critical_count} critical issues found. Immediate attention required."
@@ -454,9 +639,9 @@ class ApplicationReviewer:
         recommendations = []
         if critical_count > 0:
             recommendations.append("Fix all CRITICAL issues before deployment")
-        if issues_by_category.get("TESTING", 0) > 0:
+        if issues_by_category.get(Category.TESTING, 0) > 0:
             recommendations.append("Improve test coverage")
-        if issues_by_category.get("DOCUMENTATION", 0) > 0:
+        if issues_by_category.get(Category.DOCUMENTATION, 0) > 0:
             recommendations.append("Add missing documentation")
 
         return ReviewResult(
@@ -485,7 +670,32 @@ def review_application(app_path: str, output_format: str = "json") -> str:
     result = reviewer.review()
 
     if output_format == "json":
-        return json.dumps(asdict(result), indent=2)
+        # Build the payload directly rather than going through asdict(),
+        # which deep-copies every Issue into a dict that json.dumps then
+        # walks again; this is one traversal of the issue list instead of
+        # three. Severity is emitted by name (an IntEnum would otherwise
+        # serialize as a bare integer).
+        payload = {
+            "application_name": result.application_name,
+            "total_issues": result.total_issues,
+            "issues_by_severity": result.issues_by_severity,
+            "issues_by_category": result.issues_by_category,
+            "issues": [
+                {
+                    "severity": issue.severity.name,
+                    "category": issue.category,
+                    "file_path": issue.file_path,
+                    "line_number": issue.line_number,
+                    "description": issue.description,
+                    "recommendation": issue.recommendation,
+                    "code_snippet": issue.code_snippet,
+                }
+                for issue in result.issues
+            ],
+            "summary": result.summary,
+            "recommendations": result.recommendations,
+        }
+        return json.dumps(payload, indent=2)
     elif output_format == "markdown":
         return _format_markdown(result)
     else:
@@ -494,84 +704,76 @@ def review_application(app_path: str, output_format: str = "json") -> str:
 
 def _format_markdown(result: ReviewResult) -> str:
     """Format result as markdown."""
-    lines = [
-        f"# Application Review: {result.application_name}",
-        "",
-        f"**Summary**: {result.summary}",
-        "",
-        "## Statistics",
-        "",
-        f"- Total Issues: {result.total_issues}",
-        f"- Critical: {result.issues_by_severity.get('CRITICAL', 0)}",
-        f"- High: {result.issues_by_severity.get('HIGH', 0)}",
-        f"- Medium: {result.issues_by_severity.get('MEDIUM', 0)}",
-        f"- Low: {result.issues_by_severity.get('LOW', 0)}",
-        "",
-        "## Issues",
-        ""
-    ]
-
-    # Group by severity
-    for severity in ["CRITICAL", "HIGH", "MEDIUM", "LOW"]:
-        severity_issues = [i for i in result.issues if i.severity == severity]
+    buf = io.StringIO()
+    write = buf.write
+    write(f"# Application Review: {result.application_name}\n")
+    write(f"\n**Summary**: {result.summary}\n")
+    write("\n## Statistics\n\n")
+    write(f"- Total Issues: {result.total_issues}\n")
+    write(f"- Critical: {result.issues_by_severity.get(Severity.CRITICAL.name, 0)}\n")
+    write(f"- High: {result.issues_by_severity.get(Severity.HIGH.name, 0)}\n")
+    write(f"- Medium: {result.issues_by_severity.get(Severity.MEDIUM.name, 0)}\n")
+    write(f"- Low: {result.issues_by_severity.get(Severity.LOW.name, 0)}\n")
+    write("\n## Issues\n\n")
+
+    # Group by severity with a single pass; the IntEnum value indexes
+    # straight into the bucket list
+    buckets = [[] for _ in Severity]
+    for issue in result.issues:
+        buckets[issue.severity].append(issue)
+
+    for severity in Severity:
+        severity_issues = buckets[severity]
         if severity_issues:
-            lines.append(f"### {severity} Issues")
-            lines.append("")
+            write(f"### {severity} Issues\n\n")
             for issue in severity_issues:
-                lines.append(f"#### {issue.file_path}")
+                write(f"#### {issue.file_path}\n")
                 if issue.line_number:
-                    lines.append(f"**Line {issue.line_number}**: {issue.description}")
+                    write(f"**Line {issue.line_number}**: {issue.description}\n")
                 else:
-                    lines.append(f"**{issue.description}**")
+                    write(f"**{issue.description}**\n")
                 if issue.recommendation:
-                    lines.append(f"- Recommendation: {issue.recommendation}")
+                    write(f"- Recommendation: {issue.recommendation}\n")
                 if issue.code_snippet:
-                    lines.append(f"```python\n{issue.code_snippet}\n```")
-                lines.append("")
+                    write(f"```python\n{issue.code_snippet}\n```\n")
+                write("\n")
 
     if result.recommendations:
-        lines.append("## Recommendations")
-        lines.append("")
+        write("## Recommendations\n\n")
         for rec in result.recommendations:
-            lines.append(f"- {rec}")
-        lines.append("")
+            write(f"- {rec}\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def _format_text(result: ReviewResult) -> str:
     """Format result as plain text."""
-    lines = [
-        f"Application Review: {result.application_name}",
-        "=" * 60,
-        f"Summary: {result.summary}",
-        "",
-        f"Total Issues: {result.total_issues}",
-        f"  Critical: {result.issues_by_severity.get('CRITICAL', 0)}",
-        f"  High: {result.issues_by_severity.get('HIGH', 0)}",
-        f"  Medium: {result.issues_by_severity.get('MEDIUM', 0)}",
-        f"  Low: {result.issues_by_severity.get('LOW', 0)}",
-        "",
-        "Issues:",
-        ""
-    ]
+    buf = io.StringIO()
+    write = buf.write
+    write(f"Application Review: {result.application_name}\n")
+    write("=" * 60 + "\n")
+    write(f"Summary: {result.summary}\n\n")
+    write(f"Total Issues: {result.total_issues}\n")
+    write(f"  Critical: {result.issues_by_severity.get(Severity.CRITICAL.name, 0)}\n")
+    write(f"  High: {result.issues_by_severity.get(Severity.HIGH.name, 0)}\n")
+    write(f"  Medium: {result.issues_by_severity.get(Severity.MEDIUM.name, 0)}\n")
+    write(f"  Low: {result.issues_by_severity.get(Severity.LOW.name, 0)}\n")
+    write("\nIssues:\n\n")
 
     for issue in result.issues:
-        lines.append(f"[{issue.severity}] {issue.file_path}")
+        write(f"[{issue.severity.name}] {issue.file_path}\n")
         if issue.line_number:
-            lines.append(f"  Line {issue.line_number}: {issue.description}")
+            write(f"  Line {issue.line_number}: {issue.description}\n")
         else:
-            lines.append(f"  {issue.description}")
+            write(f"  {issue.description}\n")
         if issue.recommendation:
-            lines.append(f"  -> {issue.recommendation}")
-        lines.append("")
+            write(f"  -> {issue.recommendation}\n")
+        write("\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 if __name__ == "__main__":
-    import sys
-
     if len(sys.argv) < 2:
         print("Usage: application_review.py <app_path> [output_format]")
         print("  output_format: json, text, markdown (default: json)")
@@ -11,14 +11,144 @@ Usage:
 
 import os
 import sys
+import glob
+import json
+import hashlib
+import time
+import functools
+import shlex
+import shutil
 import subprocess
 import logging
-import tempfile
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Best-effort cache so warm runs skip re-probing arduino-cli and the
+# installed cores (core list alone can take hundreds of ms)
+CACHE_DIR = Path.home() / ".cache" / "arduino_upload"
+STATE_FILE = CACHE_DIR / "state.json"
+CACHE_TTL_SECONDS = 86400  # 24 hours
+
+
+def _load_state() -> dict:
+    """
+    Load cached tool state.
+
+    Returns:
+        Cached state dict, or {} when missing or unreadable.
+    """
+    try:
+        with open(STATE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(state: dict):
+    """
+    Persist tool state. Failures are ignored; the cache is best-effort.
+
+    Args:
+        state: State dict to write.
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(STATE_FILE, 'w') as f:
+            json.dump(state, f)
+    except OSError:
+        pass
+
+
+def _timed(phase: str):
+    """
+    Decorator printing the wall-clock duration of a build phase.
+
+    Also appends the timing as a JSON line to
+    ~/.cache/arduino_upload/timings.ndjson so slow-build regressions can
+    be spotted after the fact.
+
+    Args:
+        phase: Short phase label, e.g. "compile" or "upload".
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            dt = time.perf_counter() - start
+            print(f"[{phase}] {dt * 1000:.0f} ms")
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                with open(CACHE_DIR / "timings.ndjson", 'a') as f:
+                    json.dump({"phase": phase, "ms": round(dt * 1000), "ts": time.time()}, f)
+                    f.write("\n")
+            except OSError:
+                pass
+            return result
+        return wrapper
+    return decorator
+
+
+def run_streaming(cmd) -> int:
+    """
+    Run a command, streaming its output line by line to stdout.
+
+    Unlike capture_output=True this does not buffer a whole (possibly
+    multi-MB) build log in memory, and errors appear as they happen.
+
+    Args:
+        cmd: Command argument list.
+
+    Returns:
+        Process return code, or -1 if the process could not be started.
+    """
+    try:
+        # Spawn-cost note: no call site in this module uses preexec_fn,
+        # pass_fds or shell=True, which keeps CPython's vfork/posix_spawn
+        # fast paths available. posix_spawn itself additionally requires
+        # close_fds=False (until 3.13 on recent glibc) and an executable
+        # path with a directory component, so with the safe close_fds
+        # default these calls still go through fork/vfork+exec on most
+        # interpreters; the main thing to preserve is never adding a
+        # preexec_fn, which forces the slowest path.
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+    except (subprocess.SubprocessError, OSError) as e:
+        print(f"Error running {cmd[0]}: {e}")
+        return -1
+
+    with process.stdout:
+        for line in process.stdout:
+            sys.stdout.write(line)
+    return process.wait()
+
+
+def _report_failure(stdout, stderr):
+    """
+    Print a failed child process's captured output to stderr.
+
+    Only the capture_output call sites need this; the streamed ones have
+    already shown their output by the time they fail.
+
+    Args:
+        stdout: Captured standard output, str or bytes.
+        stderr: Captured standard error, str or bytes.
+    """
+    for chunk in (stderr, stdout):
+        if chunk:
+            if isinstance(chunk, bytes):
+                chunk = chunk.decode(errors="replace")
+            sys.stderr.write(chunk if chunk.endswith("\n") else chunk + "\n")
+
 
 def install_arduino_cli() -> Optional[Path]:
     """
@@ -36,42 +166,41 @@ def install_arduino_cli() -> Optional[Path]:
     install_script_url = "https://raw.githubusercontent.com/arduino/arduino-cli/master/install.sh"
 
     try:
-        # Download installer script
-        curl_result = subprocess.run(
-            ["curl", "-fsSL", install_script_url],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        # Save installer script temporarily
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sh', delete=False) as tmp_script:
-            tmp_script.write(curl_result.stdout)
-            tmp_script_path = tmp_script.name
-
-        # Make executable and run installer (uses default system location)
-        os.chmod(tmp_script_path, 0o755)
-
-        install_result = subprocess.run(
-            ["bash", tmp_script_path],
-            capture_output=True,
-            text=True,
-            check=False
-        )
-
-        # Clean up temp script
-        os.unlink(tmp_script_path)
-
-        if install_result.returncode == 0:
-            # Check if arduino-cli is now in PATH
-            which_result = subprocess.run(
-                ["which", "arduino-cli"],
+        script = None
+        try:
+            # Download installer script in-process; no curl fork or temp file
+            with urllib.request.urlopen(install_script_url, timeout=30) as response:
+                script = response.read()
+        except OSError as e:
+            # urllib can be blocked where curl works (proxy setups); fall
+            # back to one shell that pipes curl straight into sh
+            print(f"Direct download failed ({e}), falling back to curl...")
+
+        if script is not None:
+            # Pipe the script straight into sh's stdin
+            installer = subprocess.Popen(
+                ["sh"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=False
+            )
+            install_stdout, install_stderr = installer.communicate(script)
+            returncode = installer.returncode
+        else:
+            fallback = subprocess.run(
+                ["sh", "-c", f"curl -fsSL {shlex.quote(install_script_url)} | sh"],
                 capture_output=True,
-                text=True,
                 check=False
             )
-            if which_result.returncode == 0:
-                cli_path = Path(which_result.stdout.strip())
+            install_stdout, install_stderr = fallback.stdout, fallback.stderr
+            returncode = fallback.returncode
+
+        if returncode == 0:
+            # Check if arduino-cli is now in PATH (in-process, no fork)
+            cli = shutil.which("arduino-cli")
+            if cli:
+                cli_path = Path(cli)
                 print(f"✓ arduino-cli installed successfully to {cli_path}")
                 return cli_path
             else:
@@ -80,10 +209,7 @@ def install_arduino_cli() -> Optional[Path]:
                 return None
         else:
             print("✗ Installation failed!")
-            if install_result.stderr:
-                print(install_result.stderr)
-            if install_result.stdout:
-                print(install_result.stdout)
+            _report_failure(install_stdout, install_stderr)
             return None
 
     except (subprocess.SubprocessError, OSError) as e:
@@ -105,15 +231,19 @@ def find_arduino_cli(auto_install: bool = True) -> Optional[Path]:
     Returns:
         Path to arduino-cli or None if not found and installation failed.
     """
-    # Check system PATH first
-    which_result = subprocess.run(
-        ["which", "arduino-cli"],
-        capture_output=True,
-        text=True,
-        check=False
-    )
-    if which_result.returncode == 0:
-        return Path(which_result.stdout.strip())
+    # Cached path from a previous run, if it still exists
+    state = _load_state()
+    cached_path = state.get("cli_path")
+    if cached_path and os.path.exists(cached_path):
+        return Path(cached_path)
+
+    # Check system PATH first (shutil.which walks PATH in-process
+    # instead of forking a `which` subprocess)
+    cli = shutil.which("arduino-cli")
+    if cli:
+        state["cli_path"] = cli
+        _save_state(state)
+        return Path(cli)
 
     # Not found - install on demand if requested
     if auto_install:
@@ -129,28 +259,37 @@ def find_arduino_port() -> Optional[str]:
     Returns:
         Port path (e.g., /dev/ttyUSB0) or None if not found.
     """
-    # Check common USB serial ports
-    common_ports = ["/dev/ttyUSB0", "/dev/ttyUSB1", "/dev/ttyACM0", "/dev/ttyACM1"]
-
-    for port in common_ports:
-        if os.path.exists(port):
-            return port
-
-    # Try to find via lsusb (CH340)
+    # One directory scan covers every ttyUSB*/ttyACM* node, including
+    # higher indexes the old hardcoded list missed. A tty node existing
+    # already implies the kernel bound the USB-serial driver, so no
+    # lsusb confirmation pass is needed.
     try:
-        lsusb_result = subprocess.run(
-            ["lsusb"],
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        if lsusb_result.returncode == 0 and ("CH340" in lsusb_result.stdout or "7523" in lsusb_result.stdout):
-            # CH340 found, check for ttyUSB devices
-            for port in common_ports:
-                if os.path.exists(port):
-                    return port
-    except (subprocess.SubprocessError, OSError):
-        pass
+        with os.scandir("/dev") as entries:
+            ports = [
+                entry.path for entry in entries
+                if entry.name.startswith(("ttyUSB", "ttyACM"))
+            ]
+    except OSError:
+        return None
+
+    if ports:
+        # ttyUSB* first — the CH340 always enumerates there — then
+        # lexicographic, matching the historical probe order
+        ports.sort(key=lambda p: ("/dev/ttyACM" in p, p))
+        return ports[0]
+
+    # No tty node: check sysfs for the CH340 VID (1a86) with plain reads
+    # — no lsusb fork — to tell "not plugged in" apart from "plugged in
+    # but driver not bound"
+    for vendor_file in glob.glob("/sys/bus/usb/devices/*/idVendor"):
+        try:
+            with open(vendor_file) as f:
+                if "1a86" in f.read():
+                    print("CH340 device detected on USB but no tty node exists; "
+                          "is the ch341 driver loaded?")
+                    break
+        except OSError:
+            continue
 
     return None
 
@@ -165,6 +304,34 @@ def ensure_avr_core_installed(arduino_cli: Path) -> bool:
     Returns:
         True if core is available (or was successfully installed), False otherwise.
     """
+    # A recent successful check for the same arduino-cli binary means
+    # the slow `core list` subprocess can be skipped entirely
+    try:
+        cli_mtime = os.path.getmtime(arduino_cli)
+    except OSError:
+        cli_mtime = None
+    state = _load_state()
+    if (state.get("avr_core_ok")
+            and state.get("cli_mtime") == cli_mtime
+            and time.time() - state.get("ts", 0) < CACHE_TTL_SECONDS):
+        return True
+
+    # An installed core always leaves its package directory behind, so a
+    # stat answers the common case without paying arduino-cli's Go
+    # runtime cold start
+    if sys.platform == "win32":
+        arduino15 = Path(os.environ.get("LOCALAPPDATA", "")) / "Arduino15"
+    else:
+        arduino15 = Path.home() / ".arduino15"
+    avr_dir = arduino15 / "packages" / "arduino" / "hardware" / "avr"
+    try:
+        if avr_dir.is_dir() and any(avr_dir.iterdir()):
+            state.update({"avr_core_ok": True, "cli_mtime": cli_mtime, "ts": time.time()})
+            _save_state(state)
+            return True
+    except OSError:
+        pass
+
     # Check if AVR core is installed
     check_cmd = [
         str(arduino_cli),
@@ -182,6 +349,8 @@ def ensure_avr_core_installed(arduino_cli: Path) -> bool:
 
         # Check if arduino:avr is in the output
         if result.returncode == 0 and "arduino:avr" in result.stdout:
+            state.update({"avr_core_ok": True, "cli_mtime": cli_mtime, "ts": time.time()})
+            _save_state(state)
             return True
 
         # Core not found - install it
@@ -202,13 +371,12 @@ def ensure_avr_core_installed(arduino_cli: Path) -> bool:
 
         if install_result.returncode == 0:
             print("✓ Arduino AVR core installed successfully!")
+            state.update({"avr_core_ok": True, "cli_mtime": cli_mtime, "ts": time.time()})
+            _save_state(state)
             return True
         else:
             print("✗ Failed to install Arduino AVR core!")
-            if install_result.stderr:
-                print(install_result.stderr)
-            if install_result.stdout:
-                print(install_result.stdout)
+            _report_failure(install_result.stdout, install_result.stderr)
             return False
 
     except (subprocess.SubprocessError, OSError) as e:
@@ -216,16 +384,70 @@ def ensure_avr_core_installed(arduino_cli: Path) -> bool:
         return False
 
 
-def compile_sketch(arduino_cli: Path, sketch_path: Path) -> bool:
+_SOURCE_SUFFIXES = (".ino", ".h", ".cpp", ".c")
+
+
+def _sketch_fingerprint(sketch_path: Path, arduino_cli: Path, fqbn: str) -> Optional[str]:
     """
-    Compile Arduino sketch.
+    Fingerprint a sketch's sources plus the toolchain that builds them.
+
+    Hashes (name, mtime_ns, size) of every source file under the sketch
+    directory together with the arduino-cli binary mtime and the FQBN,
+    so any change that could affect the build output changes the digest.
+
+    Args:
+        sketch_path: Sketch directory.
+        arduino_cli: Path to arduino-cli executable.
+        fqbn: Fully qualified board name used for the build.
+
+    Returns:
+        Hex digest, or None if the fingerprint could not be computed.
+    """
+    entries = []
+
+    def scan(directory: str):
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    scan(entry.path)
+                elif entry.name.endswith(_SOURCE_SUFFIXES):
+                    info = entry.stat()
+                    entries.append((entry.path, info.st_mtime_ns, info.st_size))
+
+    try:
+        scan(str(sketch_path))
+        cli_mtime = arduino_cli.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    entries.sort()
+    digest = hashlib.blake2b(repr((entries, cli_mtime, fqbn)).encode())
+    return digest.hexdigest()
+
+
+@_timed("compile")
+def compile_sketch(
+    arduino_cli: Path,
+    sketch_path: Path,
+    upload_port: Optional[str] = None
+) -> bool:
+    """
+    Compile Arduino sketch, optionally uploading in the same invocation.
+
+    Skips the arduino-cli invocation entirely when the sketch sources and
+    toolchain are unchanged since the last successful compile (compile-only
+    mode). With upload_port set, compile and upload share one arduino-cli
+    process, paying its startup cost once instead of twice.
 
     Args:
         arduino_cli: Path to arduino-cli executable.
         sketch_path: Path to sketch directory or .ino file.
+        upload_port: Serial port to upload to after a successful build,
+            or None to compile only.
 
     Returns:
-        True if compilation successful, False otherwise.
+        True if compilation (and upload, if requested) successful,
+        False otherwise.
     """
     # If .ino file provided, use parent directory
     if sketch_path.is_file() and sketch_path.suffix == ".ino":
@@ -235,46 +457,67 @@ def compile_sketch(arduino_cli: Path, sketch_path: Path) -> bool:
         print(f"Error: Sketch path does not exist: {sketch_path}")
         return False
 
-    # Ensure AVR core is installed
-    if not ensure_avr_core_installed(arduino_cli):
-        print("Warning: AVR core installation failed, compilation may fail")
+    fqbn = "arduino:avr:nano:cpu=atmega328old"
+
+    # Stable per-user cache locations so warm recompiles reuse core and
+    # sketch object files instead of rebuilding from scratch
+    cache_root = CACHE_DIR / "build-cache"
+    build_path = cache_root / "builds" / hashlib.sha1(str(sketch_path).encode()).hexdigest()
+    try:
+        build_path.mkdir(parents=True, exist_ok=True)
+        (cache_root / "core").mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print(f"Warning: could not create build cache dirs: {e}")
+
+    # Even a fully cached arduino-cli build still spends time scanning
+    # libraries; skip the fork when nothing that feeds the build changed
+    stamp_file = build_path / ".stamp"
+    fingerprint = _sketch_fingerprint(sketch_path, arduino_cli, fqbn)
+    if upload_port is None and fingerprint is not None:
+        try:
+            if stamp_file.read_text() == fingerprint:
+                print(f"Sketch unchanged since last compile, skipping: {sketch_path}")
+                return True
+        except OSError:
+            pass
 
     print(f"Compiling sketch: {sketch_path}")
+    if upload_port:
+        print(f"Uploading to port after build: {upload_port}")
     print("Using old bootloader (required for CH340 clones)...")
 
     cmd = [
         str(arduino_cli),
         "compile",
-        "--fqbn", "arduino:avr:nano:cpu=atmega328old",
-        str(sketch_path)
+        "--fqbn", fqbn,
+        "--build-cache-path", str(cache_root / "core"),
+        "--build-path", str(build_path),
     ]
+    if upload_port:
+        cmd += ["-u", "-p", upload_port]
+    cmd.append(str(sketch_path))
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-
-        if result.returncode == 0:
-            print("✓ Compilation successful!")
-            if result.stdout:
-                print(result.stdout)
-            return True
+    if run_streaming(cmd) == 0:
+        if upload_port:
+            print("✓ Compilation and upload successful!")
         else:
-            print("✗ Compilation failed!")
-            if result.stderr:
-                print(result.stderr)
-            if result.stdout:
-                print(result.stdout)
-            return False
-
-    except (subprocess.SubprocessError, OSError) as e:
-        print(f"Error running arduino-cli: {e}")
-        return False
-
-
+            print("✓ Compilation successful!")
+        if fingerprint is not None:
+            try:
+                stamp_file.write_text(fingerprint)
+            except OSError as e:
+                logger.debug(f"Could not write compile stamp: {e}")
+        return True
+
+    print("✗ Compilation failed!")
+    # A failed build may mean the cached core state is stale
+    state = _load_state()
+    if state.pop("avr_core_ok", None) is not None:
+        _save_state(state)
+    return False
+
+
+@_timed("upload")
 def upload_sketch(
     arduino_cli: Path,
     sketch_path: Path,
@@ -319,57 +562,43 @@ def upload_sketch(
         str(sketch_path)
     ]
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-
-        if result.returncode == 0:
-            print("✓ Upload successful!")
-            if result.stdout:
-                print(result.stdout)
-            return True
-        else:
-            print("✗ Upload failed!")
-            if result.stderr:
-                print(result.stderr)
-            if result.stdout:
-                print(result.stdout)
-            print("\nTroubleshooting:")
-            print("1. Check that Arduino is connected")
-            print("2. Try pressing reset button on Arduino right before upload")
-            print("3. Verify port is correct: ls -la /dev/ttyUSB* /dev/ttyACM*")
-            print("4. Check user is in dialout group: groups | grep dialout")
-            return False
+    if run_streaming(cmd) == 0:
+        print("✓ Upload successful!")
+        return True
 
-    except (subprocess.SubprocessError, OSError) as e:
-        print(f"Error running arduino-cli: {e}")
-        return False
+    print("✗ Upload failed!")
+    print("\nTroubleshooting:")
+    print("1. Check that Arduino is connected")
+    print("2. Try pressing reset button on Arduino right before upload")
+    print("3. Verify port is correct: ls -la /dev/ttyUSB* /dev/ttyACM*")
+    print("4. Check user is in dialout group: groups | grep dialout")
+    return False
 
 
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: arduino_upload.py <sketch_path> [port] [--compile-only]")
-        print("\nExamples:")
-        print("  python arduino_upload.py blink")
-        print("  python arduino_upload.py blink /dev/ttyUSB0")
-        print("  python arduino_upload.py blink --compile-only")
-        sys.exit(1)
-
-    sketch_path = Path(sys.argv[1]).resolve()
-    port = None
-    compile_only = False
+    # argparse is only needed here; importing it lazily keeps --help and
+    # bad-usage exits off the module import path
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Compile and upload Arduino sketches to Nano (CH340 clone) devices.",
+        epilog="Examples:\n"
+               "  python arduino_upload.py blink\n"
+               "  python arduino_upload.py blink /dev/ttyUSB0\n"
+               "  python arduino_upload.py blink --compile-only",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("sketch_path", help="Sketch directory or .ino file")
+    parser.add_argument("port", nargs="?", default=None,
+                        help="Serial port (auto-detected if omitted)")
+    parser.add_argument("--compile-only", action="store_true",
+                        help="Compile without uploading")
+    args = parser.parse_args()
 
-    # Parse arguments
-    for arg in sys.argv[2:]:
-        if arg == "--compile-only":
-            compile_only = True
-        elif not arg.startswith("--"):
-            port = arg
+    sketch_path = Path(args.sketch_path).resolve()
+    port = args.port
+    compile_only = args.compile_only
 
     # Find arduino-cli (auto-install if not found)
     arduino_cli = find_arduino_cli(auto_install=True)
@@ -382,16 +611,34 @@ def main():
 
     print(f"Using arduino-cli: {arduino_cli}")
 
-    # Compile
-    if not compile_sketch(arduino_cli, sketch_path):
-        sys.exit(1)
-
-    # Upload (unless compile-only)
-    if not compile_only:
-        if not upload_sketch(arduino_cli, sketch_path, port):
-            sys.exit(1)
-    else:
-        print("Compile-only mode: skipping upload")
+    # Core check and port probing are independent I/O work; run them
+    # concurrently instead of serializing them around the compile
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        port_future = None
+        if not compile_only and not port:
+            port_future = executor.submit(find_arduino_port)
+        core_future = executor.submit(ensure_avr_core_installed, arduino_cli)
+
+        if not core_future.result():
+            print("Warning: AVR core installation failed, compilation may fail")
+
+        if compile_only:
+            if not compile_sketch(arduino_cli, sketch_path):
+                sys.exit(1)
+            print("Compile-only mode: skipping upload")
+        else:
+            if port_future is not None:
+                port = port_future.result()
+            if port:
+                # Compile and upload in one arduino-cli invocation,
+                # paying its startup cost once instead of twice
+                if not compile_sketch(arduino_cli, sketch_path, upload_port=port):
+                    sys.exit(1)
+            else:
+                if not compile_sketch(arduino_cli, sketch_path):
+                    sys.exit(1)
+                if not upload_sketch(arduino_cli, sketch_path, port):
+                    sys.exit(1)
 
     print("\n✓ Done!")
 